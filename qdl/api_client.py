@@ -2,19 +2,33 @@
 API client for interacting with the Quinta do Lago booking API.
 """
 
+import asyncio
 import logging
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any
 
+import diskcache
+import httpx
+import orjson
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
-from qdl.models import CourseAvailabilityResponse
-from qdl.config import QDLConfig
+from qdl.models import CourseAvailability, TeeTimeAvailability
+from qdl.config import QDLConfig, MAX_CONCURRENT_REQUESTS, MAX_CONNECTIONS
 
 logger = logging.getLogger(__name__)
 
+# Retry policy shared by the requests session and the async client
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 1
+
+# Built once; validating the availabilities list directly skips the outer model
+_AVAIL_ADAPTER = TypeAdapter(list[TeeTimeAvailability])
+
 
 class QDLAPIError(Exception):
     """Custom exception for QDL API errors."""
@@ -29,29 +43,94 @@ class QDLAPIClient:
         """Initialize the API client."""
         self.config = config or QDLConfig()
         self.session = self._create_session()
+        self.async_client: httpx.AsyncClient | None = None
+        self.cache = self._create_cache()
 
     @staticmethod
     def _create_session() -> requests.Session:
-        """Create a requests session with retry strategy."""
+        """Create a requests session with retry strategy and connection pooling."""
         session = requests.Session()
 
         # Configure retry strategy
         retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
+            total=MAX_RETRIES,
+            backoff_factor=BACKOFF_FACTOR,
+            status_forcelist=sorted(RETRY_STATUSES),
             allowed_methods=["HEAD", "GET", "OPTIONS"],
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Size the pool to match the number of concurrent requests
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=MAX_CONCURRENT_REQUESTS,
+            pool_maxsize=MAX_CONCURRENT_REQUESTS,
+            pool_block=False,
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
+        # Reuse connections across calls
+        session.headers["Connection"] = "keep-alive"
+
         return session
 
+    def _create_cache(self) -> diskcache.Cache | None:
+        """Create the on-disk response cache, unless caching is disabled."""
+        if self.config.cache_ttl <= 0:
+            return None
+
+        return diskcache.Cache(self.config.cache_dir)
+
+    @staticmethod
+    def _cache_key(date: str, time: str, course_id: str, n_players: int) -> str:
+        """Build the cache key for a single availability request."""
+        return f"{date}|{time}|{course_id}|{n_players}"
+
+    def _get_cached(self, key: str) -> Any:
+        """Return the cached JSON response for a key, or None on a miss."""
+        if self.cache is None:
+            return None
+
+        return self.cache.get(key)
+
+    def _set_cached(self, key: str, data: Any) -> None:
+        """Store a validated JSON response in the cache."""
+        if self.cache is None:
+            return None
+
+        self.cache.set(key, data, expire=self.config.cache_ttl)
+        return None
+
+    @staticmethod
+    def _parse_response(data: Any) -> CourseAvailability:
+        """Validate a decoded availability response."""
+        if not isinstance(data, dict):
+            raise TypeError(f"Expected a JSON object, got {type(data).__name__}")
+
+        name = data.get("name")
+        if not isinstance(name, str):
+            raise TypeError(f"Expected a string course name, got {name!r}")
+
+        availabilities = _AVAIL_ADAPTER.validate_python(data.get("availabilities", []))
+        return CourseAvailability(name=name, availabilities=availabilities)
+
+    def _create_async_client(self) -> httpx.AsyncClient:
+        """Create an HTTP/2 async client that multiplexes requests."""
+        limits = httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_CONNECTIONS,
+        )
+        # Transport retries cover connection errors; see _get_with_retries for
+        # status codes
+        transport = httpx.AsyncHTTPTransport(
+            http2=True, limits=limits, retries=MAX_RETRIES
+        )
+
+        return httpx.AsyncClient(transport=transport, timeout=self.config.api_timeout)
+
     def fetch_tee_times(
         self, date: str, time: str, course_id: str, n_players: int
-    ) -> CourseAvailabilityResponse:
+    ) -> CourseAvailability:
         """
         Fetch tee time availability for a specific date, time, and course.
 
@@ -62,7 +141,7 @@ class QDLAPIClient:
             n_players: Number of players
 
         Returns:
-            CourseAvailabilityResponse object with availability data
+            CourseAvailability with validated availability data
 
         Raises:
             QDLAPIError: If API request fails or returns invalid data
@@ -77,21 +156,91 @@ class QDLAPIClient:
         try:
             logger.debug(f"Fetching tee times for {date} {time} course {course_id}")
 
+            cache_key = self._cache_key(date, time, course_id, n_players)
+            data = self._get_cached(cache_key)
+            if data is not None:
+                logger.debug(f"Cache hit for {date} {time} course {course_id}")
+                return self._parse_response(data)
+
             response = self.session.get(
                 self.config.api_url, params=params, timeout=self.config.api_timeout
             )
             response.raise_for_status()
 
             # Parse and validate response
-            data = response.json()
-            return CourseAvailabilityResponse.model_validate(data)
+            data = orjson.loads(response.content)
+            result = self._parse_response(data)
+            self._set_cached(cache_key, data)
+            return result
 
         except requests.exceptions.RequestException as e:
             error_msg = f"API request failed for {date} {time} {course_id}: {e}"
             logger.error(error_msg)
             raise QDLAPIError(error_msg) from e
 
-        except ValidationError as e:
+        except (ValidationError, orjson.JSONDecodeError, TypeError) as e:
+            error_msg = f"Invalid API response for {date} {time} {course_id}: {e}"
+            logger.error(error_msg)
+            raise QDLAPIError(error_msg) from e
+
+        except Exception as e:
+            error_msg = f"Unexpected error for {date} {time} {course_id}: {e}"
+            logger.error(error_msg)
+            raise QDLAPIError(error_msg) from e
+
+    async def fetch_tee_times_async(
+        self, date: str, time: str, course_id: str, n_players: int
+    ) -> CourseAvailability:
+        """
+        Fetch tee time availability asynchronously over a shared HTTP/2 client.
+
+        Args:
+            date: Date in YYYY-MM-DD format
+            time: Time in HH:MM format
+            course_id: Course identifier
+            n_players: Number of players
+
+        Returns:
+            CourseAvailability with validated availability data
+
+        Raises:
+            QDLAPIError: If API request fails or returns invalid data
+        """
+        params: dict[str, str | int] = {
+            "date": date,
+            "time": time,
+            "players": n_players,
+            "course": course_id,
+        }
+
+        # Created lazily so the client is bound to the running event loop
+        if self.async_client is None:
+            self.async_client = self._create_async_client()
+
+        try:
+            logger.debug(f"Fetching tee times for {date} {time} course {course_id}")
+
+            cache_key = self._cache_key(date, time, course_id, n_players)
+            data = self._get_cached(cache_key)
+            if data is not None:
+                logger.debug(f"Cache hit for {date} {time} course {course_id}")
+                return self._parse_response(data)
+
+            response = await self._get_with_retries(self.async_client, params)
+            response.raise_for_status()
+
+            # Parse and validate response
+            data = orjson.loads(response.content)
+            result = self._parse_response(data)
+            self._set_cached(cache_key, data)
+            return result
+
+        except httpx.HTTPError as e:
+            error_msg = f"API request failed for {date} {time} {course_id}: {e}"
+            logger.error(error_msg)
+            raise QDLAPIError(error_msg) from e
+
+        except (ValidationError, orjson.JSONDecodeError, TypeError) as e:
             error_msg = f"Invalid API response for {date} {time} {course_id}: {e}"
             logger.error(error_msg)
             raise QDLAPIError(error_msg) from e
@@ -101,9 +250,72 @@ class QDLAPIClient:
             logger.error(error_msg)
             raise QDLAPIError(error_msg) from e
 
+    async def _get_with_retries(
+        self, client: httpx.AsyncClient, params: dict[str, str | int]
+    ) -> httpx.Response:
+        """
+        Request availability, retrying throttled and failed responses.
+
+        Mirrors the requests session's Retry policy: exponential backoff on
+        RETRY_STATUSES, honouring Retry-After when the server sends it.
+
+        Args:
+            client: Async HTTP client to send the request with
+            params: Query parameters for the availability endpoint
+
+        Returns:
+            The final response, which may still carry an error status
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            response = await client.get(self.config.api_url, params=params)
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                break
+
+            delay = self._retry_delay(response, attempt)
+            logger.debug(
+                f"Retrying {params['date']} {params['time']} course "
+                f"{params['course']} after HTTP {response.status_code} in {delay}s"
+            )
+            await asyncio.sleep(delay)
+
+        return response
+
+    @staticmethod
+    def _retry_delay(response: httpx.Response, attempt: int) -> float:
+        """Seconds to wait before retrying, from Retry-After or backoff."""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None and response.status_code in (429, 503):
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                pass
+            else:
+                if retry_at.tzinfo is None:
+                    retry_at = retry_at.replace(tzinfo=timezone.utc)
+                now = datetime.now(timezone.utc)
+                return max(0.0, (retry_at - now).total_seconds())
+
+        # urllib3 retries the first failure immediately, then doubles the wait
+        if attempt == 0:
+            return 0.0
+        return float(BACKOFF_FACTOR * 2**attempt)
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client, if one was opened."""
+        if self.async_client is not None:
+            await self.async_client.aclose()
+            self.async_client = None
+
     def close(self) -> None:
-        """Close the HTTP session."""
+        """Close the HTTP session and response cache."""
         self.session.close()
+        if self.cache is not None:
+            self.cache.close()
 
     def __enter__(self) -> "QDLAPIClient":
         """Context manager entry."""
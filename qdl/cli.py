@@ -3,16 +3,31 @@ Command-line interface for the Quinta do Lago tee time service.
 """
 
 import argparse
+import asyncio
 import logging
 import sys
-from datetime import date
-
-import pandas as pd
+from collections.abc import Callable
+from datetime import date, timedelta
+from typing import TYPE_CHECKING
 
 from qdl.api_client import QDLAPIClient, QDLAPIError
-from qdl.config import get_default_search_params, get_config, COURSE_IDS
-from qdl.data_processor import TeeTimeProcessor
-from qdl.models import SearchParameters
+from qdl.config import (
+    get_default_search_params,
+    get_config,
+    COURSE_IDS,
+    MAX_CONCURRENT_REQUESTS,
+)
+from qdl.data_processor import TeeTimeFileWriter, TeeTimeProcessor
+from qdl.models import SearchParameters, TeeTimeAvailability, TeeTimeRow
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Maximum number of tee times printed to the console
+DISPLAY_ROWS = 50
+
+# Every searchable start time in HH:MM format, indexed by hour
+_TIMES = tuple(f"{hour:02d}:00" for hour in range(24))
 
 
 def setup_logging(verbose: bool = False) -> None:
@@ -22,6 +37,13 @@ def setup_logging(verbose: bool = False) -> None:
         level=level, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
 
+    # httpx logs every request at INFO; keep that for --verbose only
+    if not verbose:
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        logging.getLogger("httpcore").setLevel(logging.WARNING)
+
+    return None
+
 
 def create_parser() -> argparse.ArgumentParser:
     """Create command-line argument parser."""
@@ -40,15 +62,34 @@ def create_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--end-hour", type=int, choices=range(0, 24), help="End hour (0-23)"
     )
+    parser.add_argument(
+        "--time-step",
+        type=int,
+        choices=range(1, 25),
+        help="Hours between searched start times (1-24, default: 1)",
+    )
 
     # Players
     parser.add_argument(
         "--players", type=int, choices=range(1, 5), help="Number of players (1-4)"
     )
 
+    # Filters
+    parser.add_argument("--min-price", type=float, help="Minimum tee time price")
+    parser.add_argument("--max-price", type=float, help="Maximum tee time price")
+    parser.add_argument(
+        "--hours",
+        nargs="+",
+        type=int,
+        choices=range(0, 24),
+        help="Only keep tee times starting in these hours (0-23)",
+    )
+
     # Output options
     parser.add_argument(
-        "--output", type=str, help="Output file (supports .csv, .xlsx, .json)"
+        "--output",
+        type=str,
+        help="Output file (supports .csv, .xlsx, .json, .parquet)",
     )
     parser.add_argument(
         "--display", action="store_true", help="Display results in console"
@@ -85,6 +126,25 @@ def parse_course_selection(course_args: list[str]) -> list[str]:
     return [course_map[course] for course in course_args if course in course_map]
 
 
+def build_availability_filter(
+    params: SearchParameters,
+) -> Callable[[TeeTimeAvailability], bool] | None:
+    """Build a predicate for the price and hour filters, or None if unset."""
+    if params.min_price is None and params.max_price is None and not params.hours:
+        return None
+
+    min_price = params.min_price if params.min_price is not None else float("-inf")
+    max_price = params.max_price if params.max_price is not None else float("inf")
+    hours = frozenset(f"{h:02d}" for h in params.hours) if params.hours else None
+
+    def keep(availability: TeeTimeAvailability) -> bool:
+        if not min_price <= availability.price <= max_price:
+            return False
+        return hours is None or availability.time[:2] in hours
+
+    return keep
+
+
 def validate_date_range(start_date: date, end_date: date) -> None:
     """Validate date range."""
     if start_date > end_date:
@@ -94,55 +154,156 @@ def validate_date_range(start_date: date, end_date: date) -> None:
         raise ValueError("Start date cannot be in the past")
 
 
-def fetch_all_tee_times(client: QDLAPIClient, params: SearchParameters) -> pd.DataFrame:
+def validate_price_range(min_price: float | None, max_price: float | None) -> None:
+    """Validate price range."""
+    if (min_price is not None and min_price < 0) or (
+        max_price is not None and max_price < 0
+    ):
+        raise ValueError("Prices cannot be negative")
+
+    if min_price is not None and max_price is not None and min_price > max_price:
+        raise ValueError("Minimum price must be less than or equal to maximum price")
+
+
+async def _fetch_all_records(
+    client: QDLAPIClient,
+    params: SearchParameters,
+    date_range: list[date],
+    times: tuple[str, ...],
+    sink: Callable[[list[TeeTimeRow]], None],
+) -> None:
     """
-    Fetch all tee times for the given parameters.
+    Fetch and format records for every date, time and course concurrently.
 
     Args:
         client: QDL API client
         params: Search parameters
-
-    Returns:
-        pandas DataFrame with all tee time results
+        date_range: Dates to search
+        times: Times to search in HH:MM format
+        sink: Called with the new unique TeeTimeRow tuples from each response
     """
     processor = TeeTimeProcessor()
-    all_records = []
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    filter_fn = build_availability_filter(params)
+    seen: set[TeeTimeRow] = set()
+
+    total_requests = len(date_range) * len(times) * len(params.course_ids)
+    completed_requests = 0
+
+    async def _do_one(
+        search_date: date, time_slot: str, course_id: str
+    ) -> list[TeeTimeRow]:
+        """Fetch and format tee times for a single date, time and course."""
+        async with semaphore:
+            try:
+                response = await client.fetch_tee_times_async(
+                    search_date.isoformat(), time_slot, course_id, params.n_players
+                )
+            except QDLAPIError as e:
+                logging.warning(f"Failed to fetch {search_date} {time_slot}: {e}")
+                return []
+
+        return processor.format_tee_times(response, search_date, filter_fn)
+
+    tasks = [
+        _do_one(search_date, time_slot, course_id)
+        for search_date in date_range
+        for time_slot in times
+        for course_id in params.course_ids
+    ]
+
+    try:
+        for task in asyncio.as_completed(tasks):
+            # Overlapping time windows return the same rows; keep the first copy
+            new_records = []
+            for record in await task:
+                if record in seen:
+                    continue
+                seen.add(record)
+                new_records.append(record)
+            sink(new_records)
+
+            completed_requests += 1
+            if completed_requests % 10 == 0:
+                print(f"Progress: {completed_requests}/{total_requests}")
+    finally:
+        await client.aclose()
+
+    return None
+
+
+def _search_tee_times(
+    client: QDLAPIClient,
+    params: SearchParameters,
+    sink: Callable[[list[TeeTimeRow]], None],
+) -> None:
+    """
+    Run the tee time search, passing new unique rows to a sink as they arrive.
 
+    Args:
+        client: QDL API client
+        params: Search parameters
+        sink: Called with the new unique TeeTimeRow tuples from each response
+    """
     # Generate date range
-    date_range = (
-        pd.date_range(params.start_date, params.end_date).strftime("%Y-%m-%d").tolist()
-    )
+    n_days = (params.end_date - params.start_date).days + 1
+    date_range = [params.start_date + timedelta(days=i) for i in range(n_days)]
 
-    # Generate time range
-    times = [f"{hour:02d}:00" for hour in range(params.start_hour, params.end_hour + 1)]
+    # Generate time range; each response covers a window of several hours, so
+    # larger steps skip requests whose results would be deduplicated anyway
+    times = _TIMES[params.start_hour : params.end_hour + 1 : params.time_step]
 
     total_requests = len(date_range) * len(times) * len(params.course_ids)
-    completed_requests = 0
-
     print(f"Searching {total_requests} time slots...")
 
-    for search_date in date_range:
-        print(f"Fetching tee times for {search_date}...")
+    asyncio.run(_fetch_all_records(client, params, date_range, times, sink))
+    return None
+
+
+def fetch_all_tee_times(
+    client: QDLAPIClient, params: SearchParameters
+) -> "pd.DataFrame":
+    """
+    Fetch all tee times for the given parameters.
 
-        for time_slot in times:
-            for course_id in params.course_ids:
-                try:
-                    response = client.fetch_tee_times(
-                        search_date, time_slot, course_id, params.n_players
-                    )
-                    records = processor.format_tee_times(response, search_date)
-                    all_records.extend(records)
+    Args:
+        client: QDL API client
+        params: Search parameters
 
-                except QDLAPIError as e:
-                    logging.warning(f"Failed to fetch {search_date} {time_slot}: {e}")
+    Returns:
+        pandas DataFrame with all tee time results
+    """
+    processor = TeeTimeProcessor()
+    all_records: list[TeeTimeRow] = []
 
-                completed_requests += 1
-                if completed_requests % 10 == 0:
-                    print(f"Progress: {completed_requests}/{total_requests}")
+    _search_tee_times(client, params, all_records.extend)
 
     return processor.records_to_dataframe(all_records)
 
 
+def stream_all_tee_times(
+    client: QDLAPIClient, params: SearchParameters, filename: str
+) -> int:
+    """
+    Fetch all tee times, writing them to a file as responses arrive.
+
+    Rows are written in arrival order rather than sorted, so memory use does
+    not grow with the size of the result set.
+
+    Args:
+        client: QDL API client
+        params: Search parameters
+        filename: Output filename with extension (.csv, .parquet)
+
+    Returns:
+        Number of tee time records written
+    """
+    with TeeTimeFileWriter(filename) as writer:
+        _search_tee_times(client, params, writer.write)
+
+    return writer.n_records
+
+
 def main() -> None:
     """Main CLI entry point."""
     parser = create_parser()
@@ -162,16 +323,35 @@ def main() -> None:
             params.start_hour = args.start_hour
         if args.end_hour is not None:
             params.end_hour = args.end_hour
+        if args.time_step is not None:
+            params.time_step = args.time_step
         if args.players:
             params.n_players = args.players
+        if args.min_price is not None:
+            params.min_price = args.min_price
+        if args.max_price is not None:
+            params.max_price = args.max_price
+        if args.hours:
+            params.hours = args.hours
 
         params.course_ids = parse_course_selection(args.courses)
 
         # Validate parameters
         validate_date_range(params.start_date, params.end_date)
+        validate_price_range(params.min_price, params.max_price)
 
         # Fetch tee times
         config = get_config()
+
+        # Nothing to display, so write rows to disk as they arrive
+        if args.output and not args.display and TeeTimeFileWriter.supports(args.output):
+            with QDLAPIClient(config) as client:
+                n_records = stream_all_tee_times(client, params, args.output)
+
+            print(f"\nFound {n_records} available tee times")
+            print(f"Saved results to {args.output}")
+            return None
+
         with QDLAPIClient(config) as client:
             df = fetch_all_tee_times(client, params)
 
@@ -186,7 +366,9 @@ def main() -> None:
         if args.display or not args.output:
             if not df.empty:
                 print("\nAvailable tee times:")
-                print(df.to_string(index=False))
+                print(df.head(DISPLAY_ROWS).to_string(index=False))
+                if len(df) > DISPLAY_ROWS:
+                    print(f"... ({len(df) - DISPLAY_ROWS} more rows)")
             else:
                 print("No tee times found for the specified criteria.")
 
@@ -3,6 +3,7 @@ Configuration management for the Quinta do Lago tee time service.
 """
 
 from datetime import date
+from functools import lru_cache
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -20,11 +21,23 @@ class QDLConfig(BaseSettings):
     )
     api_timeout: int = Field(default=30, description="API request timeout in seconds")
 
+    # Response Cache
+    cache_dir: str = Field(
+        default=".qdl_cache", description="Directory for cached API responses"
+    )
+    cache_ttl: int = Field(
+        default=300,
+        description="Cached response lifetime in seconds (0 disables caching)",
+    )
+
     # Default Search Parameters
     start_date: str = Field(default="2025-09-24", description="Default start date")
     end_date: str = Field(default="2025-09-30", description="Default end date")
     start_hour: int = Field(default=7, description="Default start hour")
     end_hour: int = Field(default=16, description="Default end hour")
+    time_step: int = Field(
+        default=1, description="Default hours between searched start times"
+    )
     n_players: int = Field(default=4, description="Default number of players")
 
     class Config:
@@ -45,21 +58,30 @@ COURSE_IDS = [
     "35130-201-0000000003",  # Laranjal
 ]
 
+# Number of concurrent API requests
+MAX_CONCURRENT_REQUESTS = 32
+
+# Number of HTTP/2 connections the requests are multiplexed over
+MAX_CONNECTIONS = 10
+
 
 def get_default_search_params() -> SearchParameters:
     """Get default search parameters."""
-    config = QDLConfig()
+    # Built fresh each call since callers override fields on the result
+    config = get_config()
 
     return SearchParameters(
         start_date=date.fromisoformat(config.start_date),
         end_date=date.fromisoformat(config.end_date),
         start_hour=config.start_hour,
         end_hour=config.end_hour,
+        time_step=config.time_step,
         n_players=config.n_players,
         course_ids=COURSE_IDS,
     )
 
 
+@lru_cache(maxsize=1)
 def get_config() -> QDLConfig:
-    """Get application configuration."""
+    """Get application configuration, read from the environment once."""
     return QDLConfig()
@@ -2,48 +2,85 @@
 Data processing utilities for tee time data.
 """
 
+import csv
 import logging
-import pandas as pd
+from collections.abc import Callable
+from datetime import date
+from typing import TYPE_CHECKING, Any, TextIO
 
-from qdl.models import CourseAvailabilityResponse, TeeTimeRecord
+from qdl.models import (
+    CourseAvailability,
+    CourseAvailabilityResponse,
+    TeeTimeAvailability,
+    TeeTimeRow,
+)
 from qdl.config import COURSE_NAME_MAP
 
+# pandas is slow to import, so it is only loaded once a DataFrame is needed
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
+# Output columns, in TeeTimeRow order
+TEE_TIME_COLUMNS = ["date", "time", "course", "price", "players", "start_hole"]
+
+# API start_nine to starting hole number (front nine -> 1, back nine -> 10)
+_START_HOLE_MAP = {1: 1, 2: 10}
+
+
+def _parquet_schema() -> Any:
+    """Arrow schema shared by every Parquet output path."""
+    # pyarrow is an optional dependency, only needed for Parquet output
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            ("date", pa.date32()),
+            ("time", pa.string()),
+            ("course", pa.dictionary(pa.int8(), pa.string())),
+            ("price", pa.float64()),
+            ("players", pa.int8()),
+            ("start_hole", pa.int8()),
+        ]
+    )
+
 
 class TeeTimeProcessor:
     """Processes tee time data from API responses."""
 
     @staticmethod
     def format_tee_times(
-        response: CourseAvailabilityResponse, search_date: str
-    ) -> list[TeeTimeRecord]:
+        response: CourseAvailability | CourseAvailabilityResponse,
+        search_date: date,
+        filter_fn: Callable[[TeeTimeAvailability], bool] | None = None,
+    ) -> list[TeeTimeRow]:
         """
-        Convert API response to formatted tee time records.
+        Convert API response to formatted tee time rows.
 
         Args:
-            response: CourseAvailabilityResponse from API
-            search_date: Date in YYYY-MM-DD format
+            response: Course availability from the API
+            search_date: Date the tee times were searched for
+            filter_fn: Optional predicate; availabilities it rejects are skipped
 
         Returns:
-            List of TeeTimeRecord objects
+            List of TeeTimeRow tuples
         """
         course_name = COURSE_NAME_MAP.get(response.name, response.name)
-        records = []
-
-        for availability in response.availabilities:
-            # Convert start_nine to starting hole number
-            start_hole = 1 if availability.start_nine == 1 else 10
-
-            record = TeeTimeRecord(
-                date=search_date,
-                time=availability.time,
-                course=course_name,
-                price=availability.price,
-                players=availability.players,
-                start_hole=start_hole,
+
+        # Plain tuples avoid re-validating data the response model already checked
+        records = [
+            (
+                search_date,
+                availability.time,
+                course_name,
+                availability.price,
+                availability.players,
+                _START_HOLE_MAP.get(availability.start_nine, 1),
             )
-            records.append(record)
+            for availability in response.availabilities
+            if filter_fn is None or filter_fn(availability)
+        ]
 
         logger.debug(
             f"Formatted {len(records)} tee times for {course_name} on {search_date}"
@@ -51,49 +88,171 @@ class TeeTimeProcessor:
         return records
 
     @staticmethod
-    def records_to_dataframe(records: list[TeeTimeRecord]) -> pd.DataFrame:
+    def records_to_dataframe(records: list[TeeTimeRow]) -> "pd.DataFrame":
         """
-        Convert tee time records to pandas DataFrame.
+        Convert tee time rows to pandas DataFrame.
 
         Args:
-            records: List of TeeTimeRecord objects
+            records: List of unique TeeTimeRow tuples
 
         Returns:
             pandas DataFrame with tee time data
         """
+        import pandas as pd
+
         if not records:
             # Return empty DataFrame with correct columns
-            return pd.DataFrame(
-                columns=["date", "time", "course", "price", "players", "start_hole"]
-            )
+            return pd.DataFrame(columns=TEE_TIME_COLUMNS)
 
-        # Convert records to list of dictionaries
-        data = [record.model_dump() for record in records]
-        df = pd.DataFrame(data)
+        # Transpose rows into one list per column so pandas builds each column
+        # directly; course has only a handful of values, so store it as category
+        columns: dict[str, Any] = dict(zip(TEE_TIME_COLUMNS, map(list, zip(*records))))
+        columns["date"] = pd.to_datetime(columns["date"])
+        columns["course"] = pd.Categorical(columns["course"])
+        df = pd.DataFrame(columns, copy=False)
 
-        # Remove duplicates and sort
-        df = df.drop_duplicates().sort_values(["date", "time", "course"])
-        df = df.reset_index(drop=True)
+        # players is 1-4 and start_hole is 1 or 10, so a byte each is plenty
+        df = df.astype({"players": "int8", "start_hole": "int8"})
 
-        logger.info(f"Created DataFrame with {len(df)} unique tee time records")
+        df = df.sort_values(
+            ["date", "time", "course"], ignore_index=True, kind="mergesort"
+        )
+
+        logger.info(f"Created DataFrame with {len(df)} tee time records")
         return df
 
     @staticmethod
-    def save_dataframe(df: pd.DataFrame, filename: str) -> None:
+    def save_dataframe(df: "pd.DataFrame", filename: str) -> None:
         """
         Save DataFrame to various formats based on file extension.
 
         Args:
             df: pandas DataFrame to save
-            filename: Output filename with extension (.csv, .xlsx, .json)
+            filename: Output filename with extension (.csv, .xlsx, .json, .parquet)
         """
         if filename.endswith(".csv"):
             df.to_csv(filename, index=False)
         elif filename.endswith(".xlsx"):
+            # Write dates as date cells rather than midnight datetimes
+            if not df.empty:
+                df = df.assign(date=df["date"].dt.date)
             df.to_excel(filename, index=False)
         elif filename.endswith(".json"):
+            # Write dates as YYYY-MM-DD rather than epoch milliseconds
+            if not df.empty:
+                df = df.assign(date=df["date"].dt.strftime("%Y-%m-%d"))
             df.to_json(filename, orient="records", indent=2)
+        elif filename.endswith(".parquet"):
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            # Match TeeTimeFileWriter's schema so both paths write the same file
+            if not df.empty:
+                df = df.assign(date=df["date"].dt.date)
+            table = pa.Table.from_pandas(
+                df, schema=_parquet_schema(), preserve_index=False
+            )
+            pq.write_table(table.replace_schema_metadata(None), filename)
         else:
             raise ValueError(f"Unsupported file format: {filename}")
 
         logger.info(f"Saved {len(df)} records to {filename}")
+
+
+class TeeTimeFileWriter:
+    """Streams tee time rows to a CSV or Parquet file as they arrive."""
+
+    STREAMING_FORMATS = (".csv", ".parquet")
+
+    # Rows buffered per Parquet row group; one group per response bloats metadata
+    PARQUET_ROW_GROUP_SIZE = 64 * 1024
+
+    def __init__(self, filename: str) -> None:
+        """
+        Open the output file and write its header or schema.
+
+        Args:
+            filename: Output filename with extension (.csv, .parquet)
+        """
+        if not self.supports(filename):
+            raise ValueError(f"Unsupported streaming format: {filename}")
+
+        self.filename = filename
+        self.n_records = 0
+        self._csv_file: TextIO | None = None
+        self._csv_writer: Any = None
+        self._parquet_writer: Any = None
+        self._parquet_rows: list[TeeTimeRow] = []
+
+        if filename.endswith(".csv"):
+            self._csv_file = open(filename, "w", newline="")
+            self._csv_writer = csv.writer(self._csv_file)
+            self._csv_writer.writerow(TEE_TIME_COLUMNS)
+        else:
+            import pyarrow.parquet as pq
+
+            self._schema = _parquet_schema()
+            self._parquet_writer = pq.ParquetWriter(filename, self._schema)
+
+    @classmethod
+    def supports(cls, filename: str) -> bool:
+        """Check whether rows can be streamed to the given file format."""
+        return filename.endswith(cls.STREAMING_FORMATS)
+
+    def write(self, records: list[TeeTimeRow]) -> None:
+        """
+        Append tee time rows to the output file.
+
+        Args:
+            records: List of TeeTimeRow tuples
+        """
+        if not records:
+            return None
+
+        if self._csv_writer is not None:
+            self._csv_writer.writerows(records)
+        else:
+            self._parquet_rows.extend(records)
+            if len(self._parquet_rows) >= self.PARQUET_ROW_GROUP_SIZE:
+                self._flush_parquet()
+
+        self.n_records += len(records)
+        return None
+
+    def _flush_parquet(self) -> None:
+        """Write buffered rows to the Parquet file as a single row group."""
+        if not self._parquet_rows:
+            return None
+
+        import pyarrow as pa
+
+        batch = pa.RecordBatch.from_arrays(
+            [
+                pa.array(column, type=field.type)
+                for column, field in zip(zip(*self._parquet_rows), self._schema)
+            ],
+            schema=self._schema,
+        )
+        self._parquet_writer.write_batch(
+            batch, row_group_size=self.PARQUET_ROW_GROUP_SIZE
+        )
+        self._parquet_rows = []
+        return None
+
+    def close(self) -> None:
+        """Flush and close the output file."""
+        if self._csv_file is not None:
+            self._csv_file.close()
+        if self._parquet_writer is not None:
+            self._flush_parquet()
+            self._parquet_writer.close()
+
+        logger.info(f"Saved {self.n_records} records to {self.filename}")
+
+    def __enter__(self) -> "TeeTimeFileWriter":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit."""
+        self.close()
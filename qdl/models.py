@@ -2,14 +2,18 @@
 Data models for the Quinta do Lago tee time service.
 """
 
+import datetime
 from datetime import date
+from typing import NamedTuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TeeTimeAvailability(BaseModel):
     """Represents a single tee time availability slot."""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     time: str = Field(..., description="Tee time in HH:MM format")
     price: float = Field(..., description="Price for the tee time")
     players: int = Field(..., description="Number of players for this slot")
@@ -21,16 +25,29 @@ class TeeTimeAvailability(BaseModel):
 class CourseAvailabilityResponse(BaseModel):
     """API response for course availability."""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     name: str = Field(..., description="Course name (Sul, Norte, Laranjal)")
     availabilities: list[TeeTimeAvailability] = Field(
         default_factory=list, description="List of available tee times"
     )
 
 
+class CourseAvailability(NamedTuple):
+    """Lightweight course availability, built without an outer model."""
+
+    name: str
+    availabilities: list[TeeTimeAvailability]
+
+
+# Formatted tee time row: (date, time, course, price, players, start_hole)
+TeeTimeRow = tuple[date, str, str, float, int, int]
+
+
 class TeeTimeRecord(BaseModel):
-    """Formatted tee time record for output."""
+    """Typed view of a formatted tee time row, for external consumers."""
 
-    date: str = Field(..., description="Date in YYYY-MM-DD format")
+    date: datetime.date = Field(..., description="Date of the tee time")
     time: str = Field(..., description="Time in HH:MM format")
     course: str = Field(..., description="Human-readable course name")
     price: float = Field(..., description="Price for the tee time")
@@ -45,7 +62,19 @@ class SearchParameters(BaseModel):
     end_date: date = Field(..., description="End date for search")
     start_hour: int = Field(7, ge=0, le=23, description="Start hour for search")
     end_hour: int = Field(16, ge=0, le=23, description="End hour for search")
+    time_step: int = Field(
+        1, ge=1, le=24, description="Hours between searched start times"
+    )
     n_players: int = Field(4, ge=1, le=4, description="Number of players")
+    min_price: float | None = Field(
+        default=None, ge=0, description="Minimum tee time price"
+    )
+    max_price: float | None = Field(
+        default=None, ge=0, description="Maximum tee time price"
+    )
+    hours: list[int] | None = Field(
+        default=None, description="Only keep tee times starting in these hours (0-23)"
+    )
     course_ids: list[str] = Field(
         default_factory=lambda: [
             "35130-201-0000000001",
@@ -0,0 +1,128 @@
+"""
+Tests for the async client's status-code retries.
+"""
+
+import asyncio
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from qdl.api_client import MAX_RETRIES, QDLAPIClient, QDLAPIError
+from qdl.config import QDLConfig
+from qdl.models import CourseAvailability
+
+SUCCESS_BODY = {
+    "name": "Sul",
+    "availabilities": [
+        {"time": "09:00", "price": 120.0, "players": 4, "start_nine": 1}
+    ],
+}
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Record retry delays instead of waiting them out."""
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+        return None
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def replay(
+    responses: list[httpx.Response],
+) -> Callable[[httpx.Request], httpx.Response]:
+    """Build a handler that returns the given responses in order."""
+    remaining = iter(responses)
+    return lambda request: next(remaining)
+
+
+def fetch(handler: Callable[[httpx.Request], httpx.Response]) -> CourseAvailability:
+    """Fetch one slot through a client backed by a mock transport."""
+    client = QDLAPIClient(QDLConfig(cache_ttl=0))
+    client.async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def run() -> CourseAvailability:
+        try:
+            return await client.fetch_tee_times_async("2026-11-02", "09:00", "1", 4)
+        finally:
+            await client.aclose()
+
+    try:
+        return asyncio.run(run())
+    finally:
+        client.close()
+
+
+def test_retries_throttled_response(sleeps: list[float]) -> None:
+    handler = replay([httpx.Response(429), httpx.Response(200, json=SUCCESS_BODY)])
+
+    result = fetch(handler)
+
+    assert result.name == "Sul"
+    assert len(result.availabilities) == 1
+    assert sleeps == [0.0]
+
+
+def test_honours_retry_after_seconds(sleeps: list[float]) -> None:
+    handler = replay(
+        [
+            httpx.Response(429, headers={"Retry-After": "7"}),
+            httpx.Response(200, json=SUCCESS_BODY),
+        ]
+    )
+
+    fetch(handler)
+
+    assert sleeps == [7.0]
+
+
+def test_honours_retry_after_http_date(sleeps: list[float]) -> None:
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    handler = replay(
+        [
+            httpx.Response(
+                429, headers={"Retry-After": format_datetime(retry_at, usegmt=True)}
+            ),
+            httpx.Response(200, json=SUCCESS_BODY),
+        ]
+    )
+
+    fetch(handler)
+
+    assert len(sleeps) == 1
+    assert 28.0 < sleeps[0] <= 30.0
+
+
+def test_backs_off_then_gives_up_after_max_retries(sleeps: list[float]) -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(503)
+
+    with pytest.raises(QDLAPIError, match="API request failed"):
+        fetch(handler)
+
+    assert len(requests) == MAX_RETRIES + 1
+    assert sleeps == [0.0, 2.0, 4.0]
+
+
+def test_does_not_retry_client_errors(sleeps: list[float]) -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(404)
+
+    with pytest.raises(QDLAPIError):
+        fetch(handler)
+
+    assert len(requests) == 1
+    assert sleeps == []